@@ -5,14 +5,194 @@ XGBoost-based model for consumer credit scoring decisions.
 Compliant with EU AI Act requirements for high-risk AI systems.
 """
 
+import functools
+import math
 import numpy as np
-from dataclasses import dataclass
-from typing import List, Dict, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, List, Dict, Mapping, Optional, Tuple, Union
 import json
+import logging
+import logging.handlers
+import operator
+import os
+import sys
+import time
+import types
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+audit_logger = logging.getLogger(f"{__name__}.audit")
+# Audit records are always emitted; the application's handlers decide where
+audit_logger.setLevel(logging.INFO)
 
-@dataclass
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:  # numba is optional; run the kernels as plain Python
+    _HAVE_NUMBA = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    _json_loads = json.loads
+
+
+# Sigmoid lookup table over [-8, 8]; linear interpolation keeps the error
+# below 1e-6 across the table range. Every scoring path goes through _sigmoid
+# and sums contributions in FEATURES order, and the kernels are compiled
+# without fastmath, so all entry points return bit-identical scores.
+_SIG_LO = -8.0
+_SIG_HI = 8.0
+_SIG_STEPS = 4096
+_SIG_SCALE = _SIG_STEPS / (_SIG_HI - _SIG_LO)
+_SIG_LUT = 1.0 / (1.0 + np.exp(-np.linspace(_SIG_LO, _SIG_HI, _SIG_STEPS + 1)))
+
+
+@njit(cache=True)
+def _sigmoid(z):
+    """Logistic sigmoid via the lookup table, exact outside its range."""
+    t = (z - _SIG_LO) * _SIG_SCALE
+    # Written so NaN also takes the exact branch and is never used as an index
+    if not (0.0 <= t < _SIG_STEPS):
+        if z >= 0.0:
+            return 1.0 / (1.0 + math.exp(-z))
+        # Stable form for large negative z, where exp(-z) would overflow
+        e = math.exp(z)
+        return e / (1.0 + e)
+    i = int(t)
+    f = t - i
+    return float(_SIG_LUT[i] * (1.0 - f) + _SIG_LUT[i + 1] * f)
+
+
+@njit(cache=True)
+def _score_and_contribs(x, w, intercept, contribs):
+    """
+    Score a single applicant and fill in per-feature contributions.
+    
+    Args:
+        x: Raw feature values in FEATURES order
+        w: Model weights in FEATURES order
+        intercept: Model intercept
+        contribs: Output array receiving weight * normalized feature
+        
+    Returns:
+        Sigmoid score in [0, 1]
+    """
+    s = intercept
+    for i in range(x.shape[0]):
+        # Normalize feature to 0-1 range (simplified)
+        xi = x[i] * 0.01 if x[i] > 1.0 else x[i]
+        c = w[i] * xi
+        contribs[i] = c
+        s += c
+    return _sigmoid(2.0 * s)
+
+
+@njit(parallel=True, cache=True)
+def _score_batch(X, w, intercept, out_score, out_contrib):
+    """
+    Score many applicants in parallel, one row per applicant.
+    
+    Args:
+        X: Raw feature matrix of shape (N, F) in FEATURES order
+        w: Model weights in FEATURES order
+        intercept: Model intercept
+        out_score: Output array of shape (N,) receiving sigmoid scores
+        out_contrib: Output array of shape (N, F) receiving contributions
+    """
+    for i in prange(X.shape[0]):
+        s = intercept
+        for j in range(X.shape[1]):
+            xij = X[i, j] * 0.01 if X[i, j] > 1.0 else X[i, j]
+            c = w[j] * xij
+            out_contrib[i, j] = c
+            s += c
+        out_score[i] = _sigmoid(2.0 * s)
+
+
+if not _HAVE_NUMBA:
+    def _score_batch(X, w, intercept, out_score, out_contrib):  # noqa: F811
+        """Vectorized NumPy equivalent of the compiled batch kernel."""
+        X_norm = np.where(X > 1.0, X * 0.01, X)
+        np.multiply(X_norm, w, out=out_contrib)
+        s = np.full(X.shape[0], intercept, dtype=np.float64)
+        for j in range(X.shape[1]):
+            s += out_contrib[:, j]
+        
+        # Same lookup-table interpolation as _sigmoid, element-wise
+        z = 2.0 * s
+        t = (z - _SIG_LO) * _SIG_SCALE
+        in_range = (t >= 0.0) & (t < _SIG_STEPS)
+        t = np.where(in_range, t, 0.0)
+        i = t.astype(np.intp)
+        f = t - i
+        out_score[:] = _SIG_LUT[i] * (1.0 - f) + _SIG_LUT[i + 1] * f
+        
+        # Out-of-range (and NaN) logits are rare; score them exactly
+        for k in np.flatnonzero(~in_range):
+            out_score[k] = _sigmoid(z[k].item())
+
+
+# Compile the kernels at import time rather than on the first prediction,
+# with read-only weights like the shared model's
+_warmup_weights = np.zeros(8)
+_warmup_weights.flags.writeable = False
+_score_and_contribs(np.zeros(8), _warmup_weights, 0.0, np.empty(8))
+_score_batch(np.zeros((1, 8)), _warmup_weights, 0.0, np.empty(1), np.empty((1, 8)))
+del _warmup_weights
+
+
+# Accepted feature value types; bools are rejected separately. Floats are
+# also checked for NaN and infinity.
+_FLOAT_TYPES = (float, np.floating)
+_NUMERIC_TYPES = (int, np.integer) + _FLOAT_TYPES
+
+# Decision labels indexed by whether the score clears the threshold
+_DECISIONS = ('denied', 'approved')
+
+# Formatted local-time prefixes for the current minute: (minute, iso, compact).
+# UTC offsets are whole minutes, so only seconds and microseconds change
+# between cache refreshes.
+_MINUTE_NS = 60_000_000_000
+_LAST_MINUTE_PREFIX: Tuple[int, str, str] = (-1, "", "")
+
+
+def _minute_prefix(minute: int) -> Tuple[int, str, str]:
+    """Return the cached timestamp prefixes for a minute since the epoch."""
+    global _LAST_MINUTE_PREFIX
+    cached = _LAST_MINUTE_PREFIX
+    if cached[0] != minute:
+        dt = datetime.fromtimestamp(minute * 60)
+        cached = (minute, dt.strftime('%Y-%m-%dT%H:%M:'), dt.strftime('%Y%m%d%H%M'))
+        _LAST_MINUTE_PREFIX = cached
+    return cached
+
+
+def _fast_iso_now_from_ns(ns: int) -> str:
+    """Local time for ns since the epoch in ISO 8601 format."""
+    minute, rem = divmod(ns, _MINUTE_NS)
+    micros = rem // 1000
+    return f"{_minute_prefix(minute)[1]}{micros // 1_000_000:02d}.{micros % 1_000_000:06d}"
+
+
+def _audit_stamp_from_ns(ns: int) -> str:
+    """Local time for ns since the epoch as YYYYMMDDHHMMSS, for audit identifiers."""
+    minute, rem = divmod(ns, _MINUTE_NS)
+    return f"{_minute_prefix(minute)[2]}{rem // 1_000_000_000:02d}"
+
+
+def _fast_iso_now() -> str:
+    """Current local time in ISO 8601 format, like datetime.now().isoformat()."""
+    return _fast_iso_now_from_ns(time.time_ns())
+
+
+@dataclass(slots=True, frozen=True)
 class CreditPrediction:
     """Result of a credit scoring prediction."""
     score: float
@@ -20,11 +200,140 @@ class CreditPrediction:
     confidence: float
     explanation: Dict[str, float]
     model_version: str = "2.1.0"
-    timestamp: str = None
+    timestamp: str = field(default_factory=_fast_iso_now, kw_only=True)
     
-    def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now().isoformat()
+    def to_dict(self, ndigits: int = 4) -> Dict:
+        """Serialize the prediction, rounding numeric fields to ndigits."""
+        return {
+            'score': round(self.score, ndigits),
+            'decision': self.decision,
+            'confidence': round(self.confidence, ndigits),
+            'explanation': {
+                feature: round(contribution, ndigits)
+                for feature, contribution in self.explanation.items()
+            },
+            'model_version': self.model_version,
+            'timestamp': self.timestamp
+        }
+
+
+class BatchPredictions:
+    """
+    Lazy view over batch scoring arrays, returned by predict_batch_view.
+    
+    A CreditPrediction is only built when a row is accessed, so code that
+    filters on the arrays directly pays no per-row allocation. All rows
+    carry the timestamp taken when the batch was scored.
+    """
+    
+    __slots__ = (
+        'scores', 'approved', 'confidences', 'contributions',
+        'explain', 'model_version', 'timestamp'
+    )
+    
+    def __init__(
+        self,
+        scores: np.ndarray,
+        approved: np.ndarray,
+        confidences: np.ndarray,
+        contributions: np.ndarray,
+        explain: Callable[[np.ndarray], Dict[str, float]],
+        model_version: str,
+        timestamp: str
+    ):
+        self.scores = scores
+        self.approved = approved
+        self.confidences = confidences
+        self.contributions = contributions
+        self.explain = explain
+        self.model_version = model_version
+        self.timestamp = timestamp
+    
+    def __len__(self) -> int:
+        return len(self.scores)
+    
+    def __getitem__(self, i):
+        """Build the prediction for row i, or a sub-view for a slice."""
+        if isinstance(i, slice):
+            return BatchPredictions(
+                self.scores[i],
+                self.approved[i],
+                self.confidences[i],
+                self.contributions[i],
+                self.explain,
+                self.model_version,
+                self.timestamp
+            )
+        i = operator.index(i)
+        return CreditPrediction(
+            score=self.scores[i].item(),
+            decision=_DECISIONS[bool(self.approved[i])],
+            confidence=self.confidences[i].item(),
+            explanation=self.explain(self.contributions[i]),
+            model_version=self.model_version,
+            timestamp=self.timestamp
+        )
+    
+    def __iter__(self) -> Iterator[CreditPrediction]:
+        for i in range(len(self)):
+            yield self[i]
+
+
+@functools.lru_cache(maxsize=1)
+def _load_demo_weights() -> Mapping:
+    """
+    Create the demo model once per process; instances share the result.
+    
+    The mapping and the weight array are read-only, so no caller can change
+    the model for every other instance.
+    """
+    # Simulated model weights (for demo), stored densely in FEATURES order
+    weights = np.array([
+        -0.35,  # debt_to_income
+        -0.25,  # credit_utilization
+        0.30,   # payment_history_score
+        0.15,   # account_age_months
+        -0.10,  # inquiry_count_6mo
+        0.20,   # income_stability
+        0.10,   # employment_length
+        0.05    # existing_accounts
+    ], dtype=np.float64)
+    weights.flags.writeable = False
+    return types.MappingProxyType({
+        'weights': weights,
+        'intercept': 0.5
+    })
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_scorer(
+    features: Tuple[str, ...],
+    weights: Tuple[float, ...],
+    intercept: float
+) -> Callable[[Dict[str, float]], Tuple[float, Tuple[float, ...]]]:
+    """
+    Generate a straight-line scoring function for a fixed model.
+    
+    The weights and intercept are baked into the function as constants, so
+    scoring runs without loops or array lookups. The sigmoid is the shared
+    _sigmoid, so scores match the array kernels exactly.
+    
+    Returns:
+        Function mapping a feature dict to (score, contributions), with
+        contributions in the given features order
+    """
+    lines = ["def _score(f):"]
+    for i, (feature, weight) in enumerate(zip(features, weights)):
+        # Normalize feature to 0-1 range (simplified)
+        lines.append(f"    x = f[{feature!r}]")
+        lines.append(f"    c{i} = {weight!r} * (x * 0.01 if x > 1.0 else x)")
+    terms = [f"c{i}" for i in range(len(features))]
+    lines.append(f"    s = {intercept!r} + {' + '.join(terms)}")
+    lines.append(f"    return _sigmoid(2.0 * s), ({', '.join(terms)},)")
+    
+    namespace = {'_sigmoid': _sigmoid}
+    exec(compile("\n".join(lines), '<score>', 'exec'), namespace)
+    return namespace['_score']
 
 
 class CreditScoringModel:
@@ -51,115 +360,268 @@ class CreditScoringModel:
         'employment_length',
         'existing_accounts'
     ]
+    _FEATURE_SET = frozenset(FEATURES)
     
     # Decision threshold
     THRESHOLD = 0.5
     
+    # Whether the load banner has been logged in this process
+    _LOAD_LOGGED = False
+    
+    # Serialized get_model_info(), filled on first use
+    _MODEL_INFO_JSON: Optional[str] = None
+    
+    __slots__ = ('model', 'model_path', '_weight_vec', '_intercept', '_score')
+    
     def __init__(self, model_path: Optional[str] = None):
         """Initialize the model."""
         self.model = None
         self.model_path = model_path
         self._load_model()
+        
+        self._weight_vec = self.model['weights']
+        self._intercept = self.model['intercept']
     
     def _load_model(self):
         """Load the trained model (simulated for demo)."""
         # In production, this would load the actual XGBoost model
         # For demo purposes, we simulate the model
-        print(f"[Model] Loading Credit Scoring Model v{self.VERSION}")
-        self.model = self._create_demo_model()
-    
-    def _create_demo_model(self):
-        """Create a demo model for demonstration purposes."""
-        # Simulated model weights (for demo)
-        return {
-            'weights': {
-                'debt_to_income': -0.35,
-                'credit_utilization': -0.25,
-                'payment_history_score': 0.30,
-                'account_age_months': 0.15,
-                'inquiry_count_6mo': -0.10,
-                'income_stability': 0.20,
-                'employment_length': 0.10,
-                'existing_accounts': 0.05
-            },
-            'intercept': 0.5
-        }
+        if not CreditScoringModel._LOAD_LOGGED:
+            logger.info("[Model] Loading Credit Scoring Model v%s", self.VERSION)
+            CreditScoringModel._LOAD_LOGGED = True
+        self.model = _load_demo_weights()
+        self._score = _compile_scorer(
+            tuple(self.FEATURES),
+            tuple(self.model['weights'].tolist()),
+            float(self.model['intercept'])
+        )
     
-    def predict(self, features: Dict[str, float]) -> CreditPrediction:
+    def predict(
+        self,
+        features: Dict[str, float],
+        explanation_topk: Optional[int] = None
+    ) -> CreditPrediction:
         """
         Make a credit scoring prediction.
         
         Args:
             features: Dictionary of input features
+            explanation_topk: If set, only explain the k largest contributions
             
         Returns:
             CreditPrediction with score, decision, and explanation
         """
         # Validate features
         self._validate_features(features)
+        self._validate_values(features)
         
-        # Calculate score (simulated)
-        score = self._calculate_score(features)
+        # Calculate score and per-feature contributions in one pass
+        score, contributions = self._calculate_score(features)
+        return self._build_prediction(score, contributions, explanation_topk)
+    
+    def predict_from_json(
+        self,
+        raw: Union[bytes, str],
+        explanation_topk: Optional[int] = None
+    ) -> CreditPrediction:
+        """
+        Make a credit scoring prediction from a JSON-encoded feature object.
         
+        Args:
+            raw: JSON object of input features, as bytes or str
+            explanation_topk: If set, only explain the k largest contributions
+            
+        Returns:
+            CreditPrediction with score, decision, and explanation
+        """
+        features = _json_loads(raw)
+        if not isinstance(features, dict):
+            raise ValueError(
+                f"Expected a JSON object of features, got {type(features).__name__}"
+            )
+        self._validate_features(features)
+        self._validate_values(features)
+        
+        # Pack straight into FEATURES order and score with the compiled kernel
+        x = np.fromiter(
+            (features[f] for f in self.FEATURES),
+            dtype=np.float64,
+            count=len(self.FEATURES)
+        )
+        contributions = np.empty(len(self.FEATURES), dtype=np.float64)
+        score = _score_and_contribs(x, self._weight_vec, self._intercept, contributions)
+        return self._build_prediction(score, contributions, explanation_topk)
+    
+    def _build_prediction(
+        self,
+        score: float,
+        contributions: np.ndarray,
+        explanation_topk: Optional[int] = None
+    ) -> CreditPrediction:
+        """Turn a score and its contributions into a CreditPrediction."""
         # Make decision
-        decision = 'approved' if score >= self.THRESHOLD else 'denied'
+        above = score >= self.THRESHOLD
+        decision = _DECISIONS[above]
         
-        # Calculate confidence
-        confidence = abs(score - self.THRESHOLD) / self.THRESHOLD
-        confidence = min(confidence, 1.0)
+        # Calculate confidence (distance from threshold, capped at 1)
+        diff = score - self.THRESHOLD
+        confidence = (diff if above else -diff) / self.THRESHOLD
+        confidence = 1.0 if confidence > 1.0 else confidence
         
         # Generate explanation (SHAP-like)
-        explanation = self._generate_explanation(features)
+        explanation = self._generate_explanation(contributions, explanation_topk)
         
         return CreditPrediction(
-            score=round(score, 4),
+            score=score,
             decision=decision,
-            confidence=round(confidence, 4),
+            confidence=confidence,
             explanation=explanation,
             model_version=self.VERSION
         )
     
+    def predict_batch(
+        self,
+        features_list: List[Dict[str, float]],
+        explanation_topk: Optional[int] = None
+    ) -> List[CreditPrediction]:
+        """
+        Make credit scoring predictions for many applicants at once.
+        
+        Args:
+            features_list: List of input feature dictionaries
+            explanation_topk: If set, only explain the k largest contributions
+            
+        Returns:
+            List of CreditPrediction, one per input, in the same order
+        """
+        X = np.empty((len(features_list), len(self.FEATURES)), dtype=np.float64)
+        for i, features in enumerate(features_list):
+            self._validate_features(features)
+            self._validate_values(features)
+            X[i] = [features[f] for f in self.FEATURES]
+        
+        scores, approved, confidences, contributions = self.predict_batch_arrays(X)
+        timestamp = _fast_iso_now()
+        
+        return [
+            CreditPrediction(
+                score=score,
+                decision=_DECISIONS[above],
+                confidence=confidence,
+                explanation=self._generate_explanation(row, explanation_topk),
+                model_version=self.VERSION,
+                timestamp=timestamp
+            )
+            for score, above, confidence, row
+            in zip(scores.tolist(), approved.tolist(), confidences.tolist(), contributions)
+        ]
+    
+    def predict_batch_arrays(
+        self,
+        X: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Score a feature matrix without building per-row prediction objects.
+        
+        Args:
+            X: Feature matrix of shape (N, len(FEATURES)) in FEATURES order
+            
+        Returns:
+            Tuple of (scores, approved mask, confidences, contributions), with
+            contributions of shape (N, len(FEATURES))
+        """
+        X = np.asarray(X)
+        if X.dtype.kind not in 'iuf':
+            raise ValueError(f"Expected a numeric feature matrix, got dtype {X.dtype}")
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        if X.ndim != 2 or X.shape[1] != len(self.FEATURES):
+            raise ValueError(
+                f"Expected feature matrix of shape (N, {len(self.FEATURES)}), got {X.shape}"
+            )
+        non_finite = ~np.isfinite(X)
+        if non_finite.any():
+            row, col = np.argwhere(non_finite)[0]
+            raise ValueError(
+                f"Feature '{self.FEATURES[col]}' must be a finite number, "
+                f"got {X[row, col].item()!r} in row {row}"
+            )
+        
+        # Score and explain every row in one kernel call
+        scores = np.empty(X.shape[0], dtype=np.float64)
+        contributions = np.empty_like(X)
+        _score_batch(X, self._weight_vec, self._intercept, scores, contributions)
+        approved = scores >= self.THRESHOLD
+        confidences = np.minimum(np.abs(scores - self.THRESHOLD) / self.THRESHOLD, 1.0)
+        return scores, approved, confidences, contributions
+    
+    def predict_batch_view(
+        self,
+        X: np.ndarray,
+        explanation_topk: Optional[int] = None
+    ) -> BatchPredictions:
+        """
+        Score a feature matrix, building prediction objects only on access.
+        
+        Args:
+            X: Feature matrix of shape (N, len(FEATURES)) in FEATURES order
+            explanation_topk: If set, only explain the k largest contributions
+            
+        Returns:
+            BatchPredictions over the scored rows, timestamped at scoring time
+        """
+        scores, approved, confidences, contributions = self.predict_batch_arrays(X)
+        return BatchPredictions(
+            scores,
+            approved,
+            confidences,
+            contributions,
+            functools.partial(self._generate_explanation, topk=explanation_topk),
+            self.VERSION,
+            _fast_iso_now()
+        )
+    
     def _validate_features(self, features: Dict[str, float]):
         """Validate input features."""
-        missing = set(self.FEATURES) - set(features.keys())
-        if missing:
+        keys = features.keys()
+        if not self._FEATURE_SET <= keys:
+            missing = set(self._FEATURE_SET).difference(keys)
             raise ValueError(f"Missing required features: {missing}")
     
-    def _calculate_score(self, features: Dict[str, float]) -> float:
-        """Calculate credit score from features."""
-        weights = self.model['weights']
-        intercept = self.model['intercept']
-        
-        score = intercept
-        for feature, weight in weights.items():
-            if feature in features:
-                # Normalize feature to 0-1 range (simplified)
-                normalized = features[feature] / 100.0 if features[feature] > 1 else features[feature]
-                score += weight * normalized
-        
-        # Sigmoid to get probability
-        score = 1 / (1 + np.exp(-score * 2))
-        return score
-    
-    def _generate_explanation(self, features: Dict[str, float]) -> Dict[str, float]:
-        """Generate SHAP-like feature contributions."""
-        weights = self.model['weights']
-        explanation = {}
+    def _validate_values(self, features: Dict[str, float]):
+        """Validate that every feature value is a finite number."""
+        for feature in self.FEATURES:
+            value = features[feature]
+            if (
+                isinstance(value, bool)
+                or not isinstance(value, _NUMERIC_TYPES)
+                or (isinstance(value, _FLOAT_TYPES) and not math.isfinite(value))
+            ):
+                raise ValueError(
+                    f"Feature '{feature}' must be a finite number, got {value!r}"
+                )
+    
+    def _calculate_score(self, features: Dict[str, float]) -> Tuple[float, np.ndarray]:
+        """Calculate credit score and per-feature contributions from features."""
+        score, contributions = self._score(features)
+        return score, np.array(contributions)
+    
+    def _generate_explanation(
+        self,
+        contributions: np.ndarray,
+        topk: Optional[int] = None
+    ) -> Dict[str, float]:
+        """Generate SHAP-like feature contributions, sorted by absolute value."""
+        if topk is not None and topk < 0:
+            raise ValueError(f"explanation_topk must be non-negative, got {topk}")
         
-        for feature, weight in weights.items():
-            if feature in features:
-                normalized = features[feature] / 100.0 if features[feature] > 1 else features[feature]
-                contribution = weight * normalized
-                explanation[feature] = round(contribution, 4)
+        # Stable sort so ties keep FEATURES order and top-k is always a
+        # prefix of the full ranking
+        order = np.argsort(-np.abs(contributions), kind='stable')[:topk]
         
-        # Sort by absolute contribution
-        explanation = dict(sorted(
-            explanation.items(), 
-            key=lambda x: abs(x[1]), 
-            reverse=True
+        return dict(zip(
+            [self.FEATURES[i] for i in order],
+            contributions[order].tolist()
         ))
-        
-        return explanation
     
     def get_model_info(self) -> Dict:
         """Get model metadata for compliance."""
@@ -172,6 +634,22 @@ class CreditScoringModel:
             'threshold': self.THRESHOLD,
             'eu_ai_act_reference': 'Annex III, Section 5(b)'
         }
+    
+    def get_model_info_json(self) -> str:
+        """Get model metadata as indented JSON, serialized once per class."""
+        cls = type(self)
+        if cls._MODEL_INFO_JSON is None:
+            cls._MODEL_INFO_JSON = json.dumps(self.get_model_info(), indent=2)
+        return cls._MODEL_INFO_JSON
+
+
+# Review reasons indexed by HumanOversight.requires_review's bitmask
+_REVIEW_REASONS = (
+    "",
+    "Low confidence prediction",
+    "Borderline score requires human review",
+    "Borderline score requires human review",
+)
 
 
 class HumanOversight:
@@ -184,53 +662,98 @@ class HumanOversight:
     REVIEW_THRESHOLD_LOW = 0.4
     REVIEW_THRESHOLD_HIGH = 0.6
     
+    __slots__ = ()
+    
     @staticmethod
-    def requires_review(prediction: CreditPrediction) -> Tuple[bool, str]:
+    def requires_review(
+        prediction: CreditPrediction,
+        _lo: float = REVIEW_THRESHOLD_LOW,
+        _hi: float = REVIEW_THRESHOLD_HIGH
+    ) -> Tuple[bool, str]:
         """
         Determine if a prediction requires human review.
         
+        The thresholds are bound as default arguments so they are read as
+        locals; callers should not pass them.
+        
         Returns:
             Tuple of (requires_review, reason)
         """
-        # Borderline decisions always require review
-        if HumanOversight.REVIEW_THRESHOLD_LOW <= prediction.score <= HumanOversight.REVIEW_THRESHOLD_HIGH:
-            return True, "Borderline score requires human review"
-        
-        # Low confidence predictions require review
-        if prediction.confidence < 0.3:
-            return True, "Low confidence prediction"
-        
-        return False, ""
+        # Bit 1: borderline score, bit 0: low confidence. Borderline
+        # decisions always require review and take precedence as the reason.
+        mask = ((_lo <= prediction.score <= _hi) << 1) | (prediction.confidence < 0.3)
+        return mask != 0, _REVIEW_REASONS[mask]
     
     @staticmethod
     def log_decision(prediction: CreditPrediction, reviewer: Optional[str] = None, override: bool = False):
         """Log a decision for audit trail."""
+        # One clock read so the timestamp and audit ID always agree
+        ns = time.time_ns()
         log_entry = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': _fast_iso_now_from_ns(ns),
             'prediction': {
-                'score': prediction.score,
+                # Same precision as CreditPrediction.to_dict()
+                'score': round(prediction.score, 4),
                 'decision': prediction.decision,
                 'model_version': prediction.model_version
             },
             'reviewer': reviewer,
             'override': override,
-            'audit_id': f"AUDIT-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+            'audit_id': f"AUDIT-{_audit_stamp_from_ns(ns)}"
         }
         
         # In production, this would write to audit log system
-        print(f"[Audit] Logged decision: {log_entry['audit_id']}")
+        audit_logger.info("[Audit] Logged decision: %s", log_entry['audit_id'])
         return log_entry
 
 
+# Handler installed by configure_audit_log, if any
+_audit_handler: Optional[logging.handlers.MemoryHandler] = None
+
+
+def configure_audit_log(path: str = 'audit.log', capacity: int = 1024) -> logging.Handler:
+    """
+    Buffer audit records and write them to a file in batches.
+    
+    Records are held in memory and flushed to the file once `capacity`
+    records accumulate, on an ERROR record, or at interpreter shutdown.
+    Calling this again with the same arguments returns the installed
+    handler; with different arguments it flushes and replaces it.
+    
+    Returns:
+        The installed handler, so callers can flush or remove it
+    """
+    global _audit_handler
+    handler = _audit_handler
+    if handler is not None:
+        if handler.capacity == capacity and handler.target.baseFilename == os.path.abspath(path):
+            return handler
+        target = handler.target
+        audit_logger.removeHandler(handler)
+        handler.close()
+        target.close()
+    
+    handler = logging.handlers.MemoryHandler(
+        capacity,
+        flushLevel=logging.ERROR,
+        target=logging.FileHandler(path, delay=True)
+    )
+    audit_logger.addHandler(handler)
+    _audit_handler = handler
+    return handler
+
+
 # Demo usage
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    
     print("=" * 60)
     print("Credit Scoring Model v2.1 - Demo")
     print("=" * 60)
     
     # Initialize model
     model = CreditScoringModel()
-    print(f"\nModel Info: {json.dumps(model.get_model_info(), indent=2)}")
+    sys.stdout.write(f"\nModel Info: {model.get_model_info_json()}\n")
     
     # Example prediction
     sample_features = {
@@ -244,15 +767,18 @@ if __name__ == '__main__':
         'existing_accounts': 5
     }
     
-    print(f"\nInput Features: {json.dumps(sample_features, indent=2)}")
+    sys.stdout.write("\nInput Features: ")
+    json.dump(sample_features, sys.stdout, indent=2)
+    sys.stdout.write("\n")
     
     prediction = model.predict(sample_features)
+    result = prediction.to_dict()
     print(f"\nPrediction:")
-    print(f"  Score: {prediction.score}")
-    print(f"  Decision: {prediction.decision}")
-    print(f"  Confidence: {prediction.confidence}")
+    print(f"  Score: {result['score']}")
+    print(f"  Decision: {result['decision']}")
+    print(f"  Confidence: {result['confidence']}")
     print(f"\nTop Feature Contributions:")
-    for feature, contribution in list(prediction.explanation.items())[:5]:
+    for feature, contribution in list(result['explanation'].items())[:5]:
         sign = "+" if contribution > 0 else ""
         print(f"  {feature}: {sign}{contribution}")
     
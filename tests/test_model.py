@@ -0,0 +1,297 @@
+"""
+Tests for the credit scoring model.
+
+Every test runs twice: once with numba compiling the scoring kernels and
+once with numba (and orjson) unavailable, exercising the pure-Python
+fallbacks.
+"""
+
+import importlib.util
+import json
+import logging
+import math
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, str(SRC))
+
+SAMPLE_FEATURES = {
+    'debt_to_income': 35.0,
+    'credit_utilization': 45.0,
+    'payment_history_score': 85.0,
+    'account_age_months': 48,
+    'inquiry_count_6mo': 2,
+    'income_stability': 0.8,
+    'employment_length': 36,
+    'existing_accounts': 5
+}
+
+
+@pytest.fixture(scope="module", params=["numba", "no_numba"])
+def model_module(request):
+    """The model module, with and without the optional accelerators."""
+    if request.param == "numba":
+        pytest.importorskip("numba")
+        import model
+        return model
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(sys.modules, "numba", None)
+        mp.setitem(sys.modules, "orjson", None)
+        spec = importlib.util.spec_from_file_location("model_no_numba", SRC / "model.py")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    assert not module._HAVE_NUMBA
+    return module
+
+
+@pytest.fixture
+def model(model_module):
+    return model_module.CreditScoringModel()
+
+
+def _applicants(features, n=200, seed=0):
+    """Random applicants, mixing 0-1 and 0-100 scaled values."""
+    rng = random.Random(seed)
+    rows = [dict(SAMPLE_FEATURES)]
+    for _ in range(n):
+        rows.append({
+            f: rng.choice([rng.random(), rng.uniform(0, 120)])
+            for f in features
+        })
+    # Far outside the sigmoid lookup table's range
+    rows.append({f: 1e5 for f in features})
+    rows.append({f: -50.0 for f in features})
+    rows.append({f: -1e6 for f in features})
+    rows.append(dict(SAMPLE_FEATURES, debt_to_income=1e6))
+    return rows
+
+
+def test_entry_points_agree_exactly(model):
+    rows = _applicants(model.FEATURES)
+    batch = model.predict_batch(rows)
+    X = np.array([[row[f] for f in model.FEATURES] for row in rows])
+    scores, approved, confidences, contributions = model.predict_batch_arrays(X)
+
+    for i, row in enumerate(rows):
+        single = model.predict(row)
+        from_json = model.predict_from_json(json.dumps(row).encode())
+        for other in (batch[i], from_json):
+            assert other.score == single.score
+            assert other.decision == single.decision
+            assert other.confidence == single.confidence
+            assert other.explanation == single.explanation
+        assert scores[i] == single.score
+        assert approved[i] == (single.decision == 'approved')
+        assert confidences[i] == single.confidence
+        assert contributions[i].tolist() == [
+            single.explanation[f] for f in model.FEATURES
+        ]
+
+
+def test_predict_sample(model):
+    result = model.predict(SAMPLE_FEATURES).to_dict()
+    assert result['score'] == 0.8288
+    assert result['decision'] == 'approved'
+    assert result['confidence'] == 0.6576
+    assert list(result['explanation'])[:3] == [
+        'payment_history_score', 'income_stability', 'debt_to_income'
+    ]
+
+
+def test_extreme_logits_saturate(model_module, model):
+    assert model.predict(dict(SAMPLE_FEATURES, debt_to_income=1e6)).score == 0.0
+    assert model.predict({f: 1e5 for f in model.FEATURES}).score == 1.0
+    assert model_module._sigmoid(-1e4) == 0.0
+    assert model_module._sigmoid(1e4) == 1.0
+    assert math.isnan(model_module._sigmoid(float('nan')))
+
+
+def test_predict_missing_features(model):
+    with pytest.raises(ValueError, match="Missing required features"):
+        model.predict({'debt_to_income': 35.0})
+
+
+def test_predict_batch_empty(model):
+    assert model.predict_batch([]) == []
+
+
+def test_predict_batch_view(model_module, model):
+    rows = _applicants(model.FEATURES, n=20)
+    X = np.array([[row[f] for f in model.FEATURES] for row in rows])
+    view = model.predict_batch_view(X, explanation_topk=3)
+
+    assert isinstance(view, model_module.BatchPredictions)
+    assert len(view) == len(rows)
+    assert view.approved.tolist() == (view.scores >= model.THRESHOLD).tolist()
+
+    # Rows are built on access, always with the batch's scoring timestamp
+    first = view[0]
+    assert view[0].timestamp == first.timestamp == view.timestamp
+    assert view[-1].timestamp == view.timestamp
+    assert first.score == model.predict(rows[0]).score
+    assert len(first.explanation) == 3
+
+    sub = view[1:3]
+    assert len(sub) == 2
+    assert [p.score for p in sub] == [view[1].score, view[2].score]
+    assert len(list(view)) == len(rows)
+
+    with pytest.raises(TypeError):
+        view[0.5]
+    with pytest.raises(IndexError):
+        view[len(rows)]
+
+
+def test_predict_batch_arrays_rejects_bad_shape(model):
+    with pytest.raises(ValueError, match="Expected feature matrix"):
+        model.predict_batch_arrays(np.zeros((3, 7)))
+
+
+def test_explanation_topk_is_prefix_of_full_ranking(model):
+    rows = _applicants(model.FEATURES, n=100)
+    # Identical inputs give tied contributions for equal-weight features
+    rows += [{f: v for f in model.FEATURES} for v in (0.0, 0.5, 1.0, 50.0)]
+    for row in rows:
+        full = list(model.predict(row).explanation.items())
+        for k in range(len(model.FEATURES) + 2):
+            topk = model.predict(row, explanation_topk=k).explanation
+            assert list(topk.items()) == full[:k]
+
+
+def test_explanation_topk_rejects_negative(model):
+    with pytest.raises(ValueError, match="explanation_topk"):
+        model.predict(SAMPLE_FEATURES, explanation_topk=-1)
+
+
+def test_to_dict_rounds_on_serialization(model):
+    prediction = model.predict(SAMPLE_FEATURES)
+    result = prediction.to_dict(ndigits=2)
+    assert result['score'] == round(prediction.score, 2)
+    assert result['confidence'] == round(prediction.confidence, 2)
+    assert result['explanation'] == {
+        f: round(c, 2) for f, c in prediction.explanation.items()
+    }
+    assert result['timestamp'] == prediction.timestamp
+
+
+def test_log_decision_entry(model_module, model):
+    prediction = model.predict(SAMPLE_FEATURES)
+    entry = model_module.HumanOversight.log_decision(prediction, reviewer="jdoe")
+    assert entry['prediction']['score'] == prediction.to_dict()['score']
+    assert entry['reviewer'] == "jdoe"
+    assert entry['override'] is False
+    # Timestamp and audit ID come from the same clock read
+    stamp = entry['timestamp'][:19].replace('-', '').replace('T', '').replace(':', '')
+    assert entry['audit_id'] == f"AUDIT-{stamp}"
+
+
+def test_audit_records_reach_application_handlers(model_module, model, caplog):
+    # Nothing configures the audit logger; the root logger stays at WARNING
+    assert logging.getLogger().level == logging.WARNING
+    prediction = model.predict(SAMPLE_FEATURES)
+    entry = model_module.HumanOversight.log_decision(prediction)
+    messages = [
+        r.getMessage() for r in caplog.records
+        if r.name == model_module.audit_logger.name
+    ]
+    assert messages == [f"[Audit] Logged decision: {entry['audit_id']}"]
+
+
+def test_configure_audit_log_is_idempotent(model_module, model, tmp_path):
+    path = tmp_path / "audit.log"
+    handler = model_module.configure_audit_log(str(path), capacity=10)
+    try:
+        assert model_module.configure_audit_log(str(path), capacity=10) is handler
+        assert model_module.audit_logger.handlers.count(handler) == 1
+
+        prediction = model.predict(SAMPLE_FEATURES)
+        entry = model_module.HumanOversight.log_decision(prediction)
+        handler.flush()
+        assert path.read_text().splitlines() == [
+            f"[Audit] Logged decision: {entry['audit_id']}"
+        ]
+
+        other = model_module.configure_audit_log(str(tmp_path / "other.log"), capacity=10)
+        assert other is not handler
+        assert handler not in model_module.audit_logger.handlers
+    finally:
+        for h in list(model_module.audit_logger.handlers):
+            target = h.target
+            model_module.audit_logger.removeHandler(h)
+            h.close()
+            target.close()
+        model_module._audit_handler = None
+
+
+def test_shared_model_is_read_only(model_module, model):
+    other = model_module.CreditScoringModel()
+    assert other.model is model.model
+    with pytest.raises(ValueError):
+        model.model['weights'][0] = 1.0
+    with pytest.raises(TypeError):
+        model.model['weights'] = np.ones(len(model.FEATURES))
+
+
+@pytest.mark.parametrize("raw", [b'[1, 2]', b'3.5', '"text"', b'null'])
+def test_predict_from_json_rejects_non_objects(model, raw):
+    with pytest.raises(ValueError, match="Expected a JSON object"):
+        model.predict_from_json(raw)
+
+
+def test_predict_from_json_accepts_str_and_bytes(model):
+    payload = json.dumps(SAMPLE_FEATURES)
+    expected = model.predict(SAMPLE_FEATURES).score
+    assert model.predict_from_json(payload).score == expected
+    assert model.predict_from_json(payload.encode()).score == expected
+
+
+def test_predict_batch_validates_every_row(model):
+    rows = [dict(SAMPLE_FEATURES), {'debt_to_income': 35.0}]
+    with pytest.raises(ValueError, match="Missing required features"):
+        model.predict_batch(rows)
+
+    for value in (None, "35", True, float('nan'), float('inf')):
+        rows = [dict(SAMPLE_FEATURES), dict(SAMPLE_FEATURES, debt_to_income=value)]
+        with pytest.raises(ValueError, match="'debt_to_income' must be a finite number"):
+            model.predict_batch(rows)
+
+
+def test_predict_batch_matches_predict_with_topk(model):
+    rows = _applicants(model.FEATURES, n=20)
+    batch = model.predict_batch(rows, explanation_topk=2)
+    assert len({p.timestamp for p in batch}) == 1
+    for row, prediction in zip(rows, batch):
+        assert prediction.explanation == model.predict(row, explanation_topk=2).explanation
+
+
+@pytest.mark.parametrize("literal", ['null', '"35"', 'true', 'NaN', 'Infinity'])
+def test_predict_from_json_rejects_invalid_values(model_module, model, literal):
+    rest = {f: v for f, v in SAMPLE_FEATURES.items() if f != 'debt_to_income'}
+    raw = '{"debt_to_income": %s, %s' % (literal, json.dumps(rest)[1:])
+    match = "'debt_to_income' must be a finite number"
+    if literal in ('NaN', 'Infinity') and model_module._json_loads is not json.loads:
+        # orjson already rejects these non-standard literals while parsing
+        match = None
+    with pytest.raises(ValueError, match=match):
+        model.predict_from_json(raw)
+
+
+@pytest.mark.parametrize("value", [None, "35", True, float('nan'), float('inf')])
+def test_predict_rejects_invalid_values(model, value):
+    with pytest.raises(ValueError, match="'debt_to_income' must be a finite number"):
+        model.predict(dict(SAMPLE_FEATURES, debt_to_income=value))
+
+
+def test_predict_batch_arrays_rejects_invalid_values(model):
+    X = np.tile([SAMPLE_FEATURES[f] for f in model.FEATURES], (3, 1))
+    X[2, 1] = np.nan
+    with pytest.raises(ValueError, match="'credit_utilization' must be a finite number"):
+        model.predict_batch_arrays(X)
+    with pytest.raises(ValueError, match="numeric feature matrix"):
+        model.predict_batch_arrays(X.astype(str))